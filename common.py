@@ -29,11 +29,13 @@
 #       Python os and shutil modules for platform operations
 # ==============================================================================
 
+import os
 import platform
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -72,6 +74,11 @@ def print_info(message: str) -> None:
     print(f"{Colors.CYAN}{message}{Colors.NC}")
 
 
+def print_info_block(lines) -> None:
+    """Print several info messages in cyan with a single write."""
+    sys.stdout.write(''.join(f"{Colors.CYAN}{line}{Colors.NC}\n" for line in lines))
+
+
 def print_section(message: str) -> None:
     """Print a section header in blue."""
     print(f"{Colors.BLUE}{message}{Colors.NC}")
@@ -107,6 +114,42 @@ def run_command(cmd: list[str], check: bool = True, capture: bool = False) -> Op
         return None
 
 
+def atomic_write(path: Path, data) -> None:
+    """
+    Atomically replace a file's contents.
+
+    The data goes to a temporary file next to the resolved target, which
+    then replaces it; a symlinked path therefore stays a symlink. The
+    existing file's mode is kept (new files get the usual umask-based
+    mode), and the temporary file is removed if anything fails.
+
+    Args:
+        path: File to write (need not exist yet)
+        data: bytes, or str (written as UTF-8 text)
+    """
+    target = Path(path).resolve()
+    text = isinstance(data, str)
+    tmp = tempfile.NamedTemporaryFile(
+        mode='w' if text else 'wb', encoding='utf-8' if text else None,
+        dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        if target.exists():
+            shutil.copymode(target, tmp.name)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp.name, 0o666 & ~umask)
+        os.replace(tmp.name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
 def get_os_type() -> str:
     """
     Get the operating system type.
@@ -269,6 +312,15 @@ def detect_language(project_root: Path) -> Optional[Language]:
     return None
 
 
+def _dir_entry_names(directory: Path) -> set:
+    """Return the names of a directory's entries (empty if unreadable)."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
 def detect_project_type(project_root: Path) -> bool:
     """
     Detect if project is a library (vs application).
@@ -285,16 +337,13 @@ def detect_project_type(project_root: Path) -> bool:
     # Check for library/application indicators
     # Go structure: api/, bootstrap/, cmd/ at root
     # Ada structure: src/api/, src/bootstrap/, src/cmd/ under src/
-    api_dir = project_root / "api"
-    api_dir_ada = project_root / "src" / "api"
-    bootstrap_dir = project_root / "bootstrap"
-    bootstrap_dir_ada = project_root / "src" / "bootstrap"
-    cmd_dir = project_root / "cmd"
-    cmd_dir_ada = project_root / "src" / "cmd"
-
-    has_api = api_dir.exists() or api_dir_ada.exists()
-    has_bootstrap = bootstrap_dir.exists() or bootstrap_dir_ada.exists()
-    has_cmd = cmd_dir.exists() or cmd_dir_ada.exists()
+    # (one listing per level instead of a stat per candidate path)
+    root_names = _dir_entry_names(project_root)
+    src_names = _dir_entry_names(project_root / "src") if "src" in root_names else set()
+
+    has_api = "api" in root_names or "api" in src_names
+    has_bootstrap = "bootstrap" in root_names or "bootstrap" in src_names
+    has_cmd = "cmd" in root_names or "cmd" in src_names
 
     # Libraries have api/ but not bootstrap/ or cmd/
     if has_api and not has_bootstrap and not has_cmd:
@@ -21,6 +21,7 @@ Output:
 
 import argparse
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -39,6 +40,8 @@ class Config:
         self.report_dir = self.coverage_dir / "report"
         self.profile_file = self.coverage_dir / "coverage.out"
         self.summary_file = self.coverage_dir / "summary.txt"
+        # Resolve the go binary once; None when go is not installed
+        self.go = shutil.which("go")
 
 
 # =============================================================================
@@ -122,7 +125,7 @@ def run_tests_with_coverage(cfg: Config, packages: list[str], verbose: bool) ->
 
     # Build test command
     cmd = [
-        "go", "test",
+        cfg.go, "test",
         f"-coverprofile={cfg.profile_file}",
         "-covermode=atomic",
     ]
@@ -164,7 +167,7 @@ def generate_reports(cfg: Config) -> bool:
     print("\n  Generating HTML report...")
     try:
         run_cmd([
-            "go", "tool", "cover",
+            cfg.go, "tool", "cover",
             f"-html={cfg.profile_file}",
             f"-o={html_file}",
         ], cwd=cfg.root)
@@ -176,7 +179,7 @@ def generate_reports(cfg: Config) -> bool:
     print("\n  Generating text summary...")
     try:
         result = run_cmd([
-            "go", "tool", "cover",
+            cfg.go, "tool", "cover",
             f"-func={cfg.profile_file}",
         ], cwd=cfg.root, capture=True)
 
@@ -229,6 +232,9 @@ def main() -> int:
     # Find project and configure
     root = find_project_root()
     cfg = Config(root)
+    if cfg.go is None:
+        print("✗ go not found in PATH")
+        return 1
 
     # Detect workspace packages
     packages = get_workspace_packages(root)
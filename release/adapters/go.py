@@ -56,9 +56,8 @@ class GoReleaseAdapter(BaseReleaseAdapter):
             return True
         if (project_root / 'go.work').exists():
             return True
-        if list(project_root.glob('**/*.go')):
-            return True
-        return False
+        # Stop the walk at the first hit instead of materializing all matches
+        return next(project_root.glob('**/*.go'), None) is not None
 
     def load_project_info(self, config) -> Tuple[str, str]:
         """
@@ -58,11 +58,17 @@ class ReleaseConfig:
     year: int = 0
     project_name: str = ""
     project_url: str = ""
+    changelog_path: Optional[Path] = None
+    windows_workflow_path: Optional[Path] = None
 
     def __post_init__(self):
         """Initialize computed fields."""
-        self.date_str = datetime.now().strftime("%Y-%m-%d")
-        self.year = datetime.now().year
+        now = datetime.now()
+        self.date_str = now.strftime("%Y-%m-%d")
+        self.year = now.year
+        self.changelog_path = self.project_root / "CHANGELOG.md"
+        self.windows_workflow_path = (
+            self.project_root / ".github" / "workflows" / "windows-release.yml")
 
     @property
     def is_prerelease(self) -> bool:
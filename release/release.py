@@ -27,12 +27,17 @@
 # ==============================================================================
 
 import argparse
-import json
+import functools
+import os
 import re
+import shutil
+import string
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -46,7 +51,75 @@ except ImportError:
 
 # Add parent directory to path for common imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from common import print_success, print_error, print_warning, print_info, print_section
+from common import (
+    print_success, print_error, print_warning, print_info, print_info_block, print_section,
+    atomic_write
+)
+
+# CHANGELOG patterns (compiled once per run)
+# Rest of a '## [version]' header line, up to where the section body starts
+# (the body itself runs to the next '## ' heading; see _find_section)
+_SECTION_START_RE = re.compile(r'\s*-?\s*[^\n]*\n')
+_UNRELEASED_HEADER = '## [Unreleased]'
+# Whitespace after _UNRELEASED_HEADER, up to where its body starts
+_UNRELEASED_START_RE = re.compile(r'\s*\n')
+# Bullet points with actual content (- followed by text)
+_BULLET_RE = re.compile(r'^-\s+\S', re.MULTILINE)
+# Placeholder text patterns, as one alternation (a single scan)
+_PLACEHOLDER_RE = re.compile(
+    r'^\s*_[^_]+_\s*$'  # Single italic line like "_Initial release._"
+    r'|TBD|placeholder|TODO',
+    re.IGNORECASE | re.MULTILINE
+)
+# A '### Heading' followed by a bullet with text (a CHANGELOG with real content)
+_HAS_CONTENT_RE = re.compile(r'###\s+\w+.*\n\s*-\s+\S', re.DOTALL)
+
+# Characters allowed in pre-release and build identifiers ('.' separates
+# them). SemVer also allows '-', but the Go and Ada adapters' version
+# package parsers do not, so it is rejected here up front.
+_SEMVER_IDENT_CHARS = frozenset(string.ascii_letters + string.digits)
+
+# Rule printed above and below step banners
+_BANNER = '=' * 70
+
+
+def _is_semver_number(part: str) -> bool:
+    """True for a SemVer numeric identifier: ASCII digits, no leading zero."""
+    return part.isascii() and part.isdigit() and (part == '0' or part[0] != '0')
+
+
+def _valid_semver(version: str) -> bool:
+    """
+    Check a release version against SemVer 2.0.0: MAJOR.MINOR.PATCH, then
+    optional -prerelease and +build dot-separated identifiers.
+
+    Plain string splitting, no regex. Numeric parts (and numeric pre-release
+    identifiers) may not have leading zeros; identifiers may not be empty.
+    """
+    rest, plus, build = version.partition('+')
+    core, dash, pre = rest.partition('-')
+
+    parts = core.split('.')
+    if len(parts) != 3 or not all(map(_is_semver_number, parts)):
+        return False
+    if dash:
+        for ident in pre.split('.'):
+            if not ident or not _SEMVER_IDENT_CHARS.issuperset(ident):
+                return False
+            if ident.isdigit() and not _is_semver_number(ident):
+                return False
+    if plus:
+        for ident in build.split('.'):
+            if not ident or not _SEMVER_IDENT_CHARS.issuperset(ident):
+                return False
+    return True
+
+
+# Adapter class per language; get_adapter builds only the one asked for
+_ADAPTER_CLASSES = {
+    Language.GO: GoReleaseAdapter,
+    Language.ADA: AdaReleaseAdapter,
+}
 
 
 def detect_language(project_root: Path) -> Optional[Language]:
@@ -66,6 +139,12 @@ def detect_language(project_root: Path) -> Optional[Language]:
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _detect_language_cached(root: str) -> Optional[Language]:
+    """detect_language, memoized per project root for repeated main() calls."""
+    return detect_language(Path(root))
+
+
 def get_adapter(language: Language):
     """
     Get the appropriate adapter for a language.
@@ -76,11 +155,8 @@ def get_adapter(language: Language):
     Returns:
         Language adapter instance
     """
-    adapters = {
-        Language.GO: GoReleaseAdapter(),
-        Language.ADA: AdaReleaseAdapter(),
-    }
-    return adapters.get(language)
+    adapter_class = _ADAPTER_CLASSES.get(language)
+    return adapter_class() if adapter_class else None
 
 
 def prompt_user_continue(message: str, allow_skip: bool = False) -> bool:
@@ -94,9 +170,9 @@ def prompt_user_continue(message: str, allow_skip: bool = False) -> bool:
     Returns:
         True if user wants to continue, False to abort
     """
-    print(f"\n{'='*70}")
-    print(f"MANUAL STEP REQUIRED")
-    print(f"{'='*70}")
+    print("\n" + _BANNER)
+    print("MANUAL STEP REQUIRED")
+    print(_BANNER)
     print(f"\n{message}\n")
 
     while True:
@@ -121,11 +197,8 @@ def prompt_user_continue(message: str, allow_skip: bool = False) -> bool:
         print("Invalid input. Please try again.")
 
 
-def create_initial_changelog(config) -> str:
-    """Create a clean Common Changelog format CHANGELOG.md for initial release."""
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    return f"""# Changelog
+# Common Changelog CHANGELOG.md for an initial release (see create_initial_changelog)
+_INITIAL_CHANGELOG_TEMPLATE = """# Changelog
 
 All notable changes to this project will be documented in this file.
 
@@ -146,9 +219,9 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 
 ---
 
-## [{config.version}] - {today}
+## [{version}] - {today}
 
-_Initial release of {config.project_name}._
+_Initial release of {project_name}._
 
 ### Added
 
@@ -164,11 +237,186 @@ _Initial release of {config.project_name}._
 ## License & Copyright
 
 - **License**: BSD-3-Clause
-- **Copyright**: (c) {config.year} Michael Gardner, A Bit of Help, Inc.
+- **Copyright**: (c) {year} Michael Gardner, A Bit of Help, Inc.
 - **SPDX-License-Identifier**: BSD-3-Clause
 """
 
 
+def create_initial_changelog(config) -> str:
+    """Create a clean Common Changelog format CHANGELOG.md for initial release."""
+    return _INITIAL_CHANGELOG_TEMPLATE.format_map({
+        'version': config.version,
+        'project_name': config.project_name,
+        'year': config.year,
+        'today': config.date_str,
+    })
+
+
+def _git(project_root: Path, *args: str, check: bool = False,
+         capture: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run a git command whose output is parsed or discarded, never shown.
+
+    Skips optional locks (no index refresh as a side effect of a query) and
+    locale setup (LC_ALL=C), which only affects messages nobody reads.
+    With capture=False the output goes to /dev/null (no pipes, no decoding)
+    for commands where only the exit status matters.
+    """
+    if capture:
+        streams = dict(capture_output=True, text=True)
+    else:
+        streams = dict(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return subprocess.run(
+        ['git', '--no-optional-locks', *args],
+        cwd=project_root,
+        env=dict(os.environ, LC_ALL='C'),
+        check=check,
+        **streams,
+    )
+
+
+def _timed(config, name: str, fn, *args, **kwargs):
+    """
+    Call fn(*args, **kwargs), logging its wall-clock time to --perf-log.
+
+    Each call appends one tab-separated line (date, version, name, seconds)
+    so the check order can be re-tuned from observed costs. Without a perf
+    log this is a plain call.
+    """
+    perf_log = getattr(config, 'perf_log', None)
+    if perf_log is None:
+        return fn(*args, **kwargs)
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        # One append-mode write per line, so concurrent checks don't interleave
+        with open(perf_log, 'a', encoding='utf-8') as f:
+            f.write(f"{config.date_str}\t{config.version}\t{name}\t{elapsed:.3f}\n")
+
+
+class _ThreadOutput:
+    """
+    Stand-in for sys.stdout/sys.stderr that buffers writes per thread.
+
+    Writes from a thread with a buffer in the shared registry are appended
+    to it as (stream, text); all other writes go straight to the stream.
+    """
+
+    def __init__(self, stream, registry: dict):
+        self._stream = stream
+        self._registry = registry
+
+    def write(self, text: str) -> int:
+        chunks = self._registry.get(threading.get_ident())
+        if chunks is None:
+            return self._stream.write(text)
+        chunks.append((self._stream, text))
+        return len(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_checks_concurrently(checks: list) -> list:
+    """
+    Run independent read-only checks concurrently.
+
+    Each check's printed output is buffered (stdout and stderr interleaved
+    as written) until all have finished.
+
+    Args:
+        checks: Zero-argument callables
+
+    Returns:
+        One function per check, in order, that replays the check's output
+        and returns its result (or raises its exception)
+    """
+    registry = {}
+
+    def run(check, chunks):
+        registry[threading.get_ident()] = chunks
+        try:
+            return check()
+        finally:
+            del registry[threading.get_ident()]
+
+    def reporter(future, chunks):
+        def report():
+            for stream, text in chunks:
+                stream.write(text)
+            return future.result()
+        return report
+
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout = _ThreadOutput(real_stdout, registry)
+    sys.stderr = _ThreadOutput(real_stderr, registry)
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, len(checks)) or 1) as pool:
+            outputs = [[] for _ in checks]
+            futures = [pool.submit(run, check, chunks)
+                       for check, chunks in zip(checks, outputs)]
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+    return [reporter(future, chunks) for future, chunks in zip(futures, outputs)]
+
+
+@functools.lru_cache(maxsize=4)
+def _read_changelog(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a CHANGELOG; cached per (path, mtime, size) by load_changelog."""
+    return Path(path_str).read_text(encoding='utf-8')
+
+
+def load_changelog(changelog_file: Path) -> str:
+    """
+    Read CHANGELOG.md, reusing the text from an earlier read this run.
+
+    The checkpoint and update_changelog each inspect the same file; the
+    cache key includes mtime and size, so edits made in between (e.g.
+    at the checkpoint prompt) are picked up.
+    """
+    st = changelog_file.stat()
+    return _read_changelog(str(changelog_file), st.st_mtime_ns, st.st_size)
+
+
+def _backup_changelog(changelog_file: Path, backup_file: Path) -> None:
+    """Keep the current CHANGELOG.md as backup_file (hardlink, copy if unsupported)."""
+    backup_file.unlink(missing_ok=True)
+    try:
+        os.link(changelog_file, backup_file)
+    except OSError:
+        shutil.copy2(changelog_file, backup_file)
+
+
+def _find_section(content: str, header: str, start_re) -> Optional[Tuple[int, int, int]]:
+    """
+    Find the first occurrence of a section header that start_re matches after.
+
+    The header is located with str.find and the body's end (the next line
+    starting with '## ', else the end of content) with another find; only
+    the short anchored start_re is a regex. Same result as searching
+    re.escape(header) + start_re + r'(.*?)(?=\n## |\Z)' with re.DOTALL.
+
+    Returns:
+        (header_start, body_start, body_end), or None
+    """
+    pos = content.find(header)
+    while pos != -1:
+        match = start_re.match(content, pos + len(header))
+        if match:
+            body_end = content.find('\n## ', match.end())
+            return pos, match.end(), body_end if body_end != -1 else len(content)
+        pos = content.find(header, pos + 1)
+    return None
+
+
+def _version_section(content: str, version: str) -> Optional[str]:
+    """Return the body of the first '## [version]' section that has one, or None."""
+    span = _find_section(content, f'## [{version}]', _SECTION_START_RE)
+    return content[span[1]:span[2]] if span else None
+
+
 def has_meaningful_content(section_content: str) -> bool:
     """
     Check if a CHANGELOG section has meaningful content.
@@ -183,21 +431,13 @@ def has_meaningful_content(section_content: str) -> bool:
         True if section has meaningful content (bullet points with text)
     """
     # Look for bullet points with actual content (- followed by text)
-    has_bullets = bool(re.search(r'^-\s+\S', section_content, re.MULTILINE))
-
-    # Check for placeholder text patterns
-    placeholder_patterns = [
-        r'^\s*_[^_]+_\s*$',  # Single italic line like "_Initial release._"
-        r'TBD',
-        r'placeholder',
-        r'TODO',
-    ]
-    is_placeholder = any(
-        re.search(pattern, section_content, re.IGNORECASE | re.MULTILINE)
-        for pattern in placeholder_patterns
-    )
+    if _BULLET_RE.search(section_content):
+        return True
 
-    return has_bullets or (not is_placeholder and len(section_content.strip()) > 50)
+    # Otherwise enough prose that is not placeholder text (the placeholder
+    # scan only runs for sections long enough to count)
+    return (len(section_content.strip()) > 50
+            and _PLACEHOLDER_RE.search(section_content) is None)
 
 
 def update_changelog(config) -> bool:
@@ -209,18 +449,16 @@ def update_changelog(config) -> bool:
     - For later versions: Update [Unreleased] to new version
     - If version section exists but is placeholder, check [Unreleased] for content
     """
-    changelog_file = config.project_root / "CHANGELOG.md"
+    changelog_file = config.changelog_path
+
+    # Read once (None if there is no CHANGELOG); every check below uses this text
+    existing_content = load_changelog(changelog_file) if changelog_file.exists() else None
 
     # Check if version already exists in CHANGELOG
-    if changelog_file.exists():
-        existing_content = changelog_file.read_text(encoding='utf-8')
-        version_match = re.search(
-            rf'## \[{re.escape(config.version)}\]\s*-?\s*[^\n]*\n(.*?)(?=\n## |\Z)',
-            existing_content,
-            re.DOTALL
-        )
-        if version_match:
-            version_content = version_match.group(1).strip()
+    if existing_content is not None:
+        version_body = _version_section(existing_content, config.version)
+        if version_body is not None:
+            version_content = version_body.strip()
             if has_meaningful_content(version_content):
                 print(f"  Version [{config.version}] already exists with content")
                 print(f"  Skipping CHANGELOG update (already prepared)")
@@ -232,11 +470,10 @@ def update_changelog(config) -> bool:
     # Handle initial release - only create template if CHANGELOG doesn't exist
     # or is essentially empty/template-only
     if config.is_initial_release:
-        if changelog_file.exists():
-            existing_content = changelog_file.read_text(encoding='utf-8')
+        if existing_content is not None:
             # Check if existing CHANGELOG has substantial content (not just a template)
             # Look for actual content beyond headers and empty sections
-            has_content = bool(re.search(r'###\s+\w+.*\n\s*-\s+\S', existing_content, re.DOTALL))
+            has_content = bool(_HAS_CONTENT_RE.search(existing_content))
             if has_content:
                 print(f"  CHANGELOG.md has existing content - preserving it")
                 print(f"  Skipping template generation for initial release")
@@ -248,42 +485,42 @@ def update_changelog(config) -> bool:
             print(f"  [DRY-RUN] Would create CHANGELOG.md for initial release {config.version}")
             return True
 
-        if changelog_file.exists():
-            backup_file = config.project_root / "CHANGELOG.md.backup"
-            changelog_file.rename(backup_file)
+        if existing_content is not None:
+            backup_file = changelog_file.with_name("CHANGELOG.md.backup")
+            _backup_changelog(changelog_file, backup_file)
             print(f"  Backed up existing CHANGELOG.md to {backup_file.name}")
 
-        changelog_file.write_text(content, encoding='utf-8')
+        atomic_write(changelog_file, content)
         print(f"  Created CHANGELOG.md for initial release {config.version}")
         return True
 
     # Handle subsequent releases
-    if not changelog_file.exists():
+    if existing_content is None:
         print_error("CHANGELOG.md not found!")
         print_info("For releases after 1.0.0, CHANGELOG.md must exist.")
         return False
 
     try:
-        content = changelog_file.read_text(encoding='utf-8')
+        content = existing_content
 
         # Check if this version already exists
-        if re.search(rf'## \[{re.escape(config.version)}\]', content):
+        if f'## [{config.version}]' in content:
             print_warning(f"Version [{config.version}] already exists in CHANGELOG.md")
             print_info("Skipping CHANGELOG update (appears to be already prepared)")
             return True
 
         # Find the [Unreleased] section
-        unreleased_pattern = r'## \[Unreleased\]\s*\n(.*?)(?=\n## |\Z)'
-        match = re.search(unreleased_pattern, content, re.DOTALL)
+        span = _find_section(content, _UNRELEASED_HEADER, _UNRELEASED_START_RE)
 
-        if not match:
+        if not span:
             print_error("Could not find [Unreleased] section in CHANGELOG.md")
             return False
 
-        unreleased_content = match.group(1).strip()
+        start, body_start, end = span
+        unreleased_content = content[body_start:end].strip()
 
         # Create new release section
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = config.date_str
         release_section = f"""## [Unreleased]
 
 ### Changed
@@ -302,20 +539,14 @@ def update_changelog(config) -> bool:
 
 """
 
-        # Replace the unreleased section
-        content = re.sub(
-            r'## \[Unreleased\]\s*\n.*?(?=\n## |\Z)',
-            release_section,
-            content,
-            flags=re.DOTALL,
-            count=1
-        )
+        # Replace the unreleased section (splice at the span already found)
+        content = content[:start] + release_section + content[end:]
 
         if config.dry_run:
             print(f"  [DRY-RUN] Would update CHANGELOG.md with release {config.version}")
             return True
 
-        changelog_file.write_text(content, encoding='utf-8')
+        atomic_write(changelog_file, content)
         print(f"  Updated CHANGELOG.md with release {config.version}")
         return True
 
@@ -324,100 +555,84 @@ def update_changelog(config) -> bool:
         return False
 
 
-def run_windows_validation(config) -> Tuple[bool, str]:
+def run_windows_validation(config, adapter) -> Tuple[bool, str]:
     """
     Trigger Windows CI workflow and wait for completion.
 
-    Uses GitHub CLI (gh) to trigger the workflow and monitor its status.
+    Talks to the GitHub REST API through the adapter's client (token and
+    repository resolved once), so polling does not start a gh process per
+    status check.
 
     Args:
         config: Release configuration
+        adapter: Language adapter (provides the GitHub API client)
 
     Returns:
         Tuple of (success, message)
     """
-    workflow_name = "windows-release.yml"
+    workflow_path = config.windows_workflow_path
+    workflow_name = workflow_path.name
 
-    # Check if gh CLI is available
+    # Resolve API credentials and repository up front
     try:
-        result = subprocess.run(
-            ["gh", "--version"],
-            capture_output=True,
-            text=True,
-            cwd=config.project_root
-        )
-        if result.returncode != 0:
-            return False, "GitHub CLI (gh) not found. Install from https://cli.github.com/"
-    except FileNotFoundError:
-        return False, "GitHub CLI (gh) not found. Install from https://cli.github.com/"
+        adapter._github_token(config)
+        repo = adapter._github_repo(config)
+    except RuntimeError as e:
+        return False, str(e)
 
     # Check if workflow file exists
-    workflow_path = config.project_root / ".github" / "workflows" / workflow_name
     if not workflow_path.exists():
         return False, f"Workflow file not found: {workflow_path}"
 
     # Get current git ref (branch or commit)
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        capture_output=True,
-        text=True,
-        cwd=config.project_root
-    )
+    result = _git(config.project_root, "rev-parse", "HEAD")
     if result.returncode != 0:
         return False, "Could not get current git commit"
     current_ref = result.stdout.strip()
 
-    print_info(f"  Triggering Windows CI workflow...")
-    print_info(f"  Ref: {current_ref[:8]}")
-    print_info(f"  Version: {config.version}")
+    print_info_block([
+        f"  Triggering Windows CI workflow...",
+        f"  Ref: {current_ref[:8]}",
+        f"  Version: {config.version}",
+    ])
 
     if config.dry_run:
         print_info("  [DRY-RUN] Would trigger Windows workflow and wait for completion")
         return True, "Dry run - skipped"
 
-    # Trigger the workflow
-    result = subprocess.run(
-        [
-            "gh", "workflow", "run", workflow_name,
-            "-f", f"version={config.version}",
-            "-f", f"ref={current_ref}"
-        ],
-        capture_output=True,
-        text=True,
-        cwd=config.project_root
-    )
-    if result.returncode != 0:
-        return False, f"Failed to trigger workflow: {result.stderr}"
+    # Trigger the workflow on the default branch (as gh workflow run does);
+    # a single attempt, since a retried dispatch could start two runs
+    workflow_api = f"/repos/{repo}/actions/workflows/{workflow_name}"
+    try:
+        default_branch = adapter._github_request(
+            config, 'GET', f"/repos/{repo}")['default_branch']
+        adapter._github_request(
+            config, 'POST', f"{workflow_api}/dispatches",
+            {'ref': default_branch,
+             'inputs': {'version': config.version, 'ref': current_ref}},
+            tries=1)
+    except (OSError, KeyError, TypeError) as e:
+        return False, f"Failed to trigger workflow: {e}"
 
     print_info("  Workflow triggered. Waiting for run to start...")
 
     # Wait a moment for the run to be created
     time.sleep(3)
 
-    # Get the most recent run ID for this workflow
-    max_attempts = 10
+    # Get the newest run of this workflow for the commit, backing off while
+    # the dispatched run is being created
     run_id = None
-    for attempt in range(max_attempts):
-        result = subprocess.run(
-            [
-                "gh", "run", "list",
-                "--workflow", workflow_name,
-                "--limit", "1",
-                "--json", "databaseId,status,headSha"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=config.project_root
-        )
-        if result.returncode == 0:
-            try:
-                runs = json.loads(result.stdout)
-                if runs and runs[0].get("headSha", "").startswith(current_ref[:7]):
-                    run_id = runs[0]["databaseId"]
-                    break
-            except json.JSONDecodeError:
-                pass
-        time.sleep(2)
+    for delay in (1, 2, 2, 4, 4, 8, 8):
+        try:
+            runs = adapter._github_request(
+                config, 'GET', f"{workflow_api}/runs?head_sha={current_ref}&per_page=1",
+                tries=1)
+        except OSError:
+            runs = None
+        if runs and runs.get('workflow_runs'):
+            run_id = runs['workflow_runs'][0]['id']
+            break
+        time.sleep(delay)
 
     if not run_id:
         return False, "Could not find workflow run. Check GitHub Actions manually."
@@ -425,34 +640,37 @@ def run_windows_validation(config) -> Tuple[bool, str]:
     print_info(f"  Run ID: {run_id}")
     print_info("  Waiting for workflow to complete (this may take several minutes)...")
 
-    # Watch the run until completion
-    result = subprocess.run(
-        ["gh", "run", "watch", str(run_id), "--exit-status"],
-        capture_output=True,
-        text=True,
-        cwd=config.project_root
-    )
-
-    if result.returncode == 0:
+    # Poll the run until completion, at growing intervals (1, 2, 4, 8, 15s...)
+    run_api = f"/repos/{repo}/actions/runs/{run_id}"
+    delay = 1
+    failures = 0
+    while True:
+        try:
+            run = adapter._github_request(config, 'GET', run_api, tries=1)
+        except OSError as e:
+            failures += 1
+            if failures >= 5:
+                return False, f"Could not read workflow run status: {e}"
+        else:
+            failures = 0
+            if run.get('status') == "completed":
+                conclusion = run.get('conclusion') or ""
+                break
+        time.sleep(delay)
+        delay = min(delay * 2, 15)
+
+    if conclusion == "success":
         return True, "Windows validation passed"
     else:
         # Get more details about the failure
-        detail_result = subprocess.run(
-            ["gh", "run", "view", str(run_id), "--json", "conclusion,jobs"],
-            capture_output=True,
-            text=True,
-            cwd=config.project_root
-        )
-        details = ""
-        if detail_result.returncode == 0:
-            try:
-                run_info = json.loads(detail_result.stdout)
-                details = f"\nConclusion: {run_info.get('conclusion', 'unknown')}"
-                for job in run_info.get("jobs", []):
-                    if job.get("conclusion") != "success":
-                        details += f"\n  Failed job: {job.get('name')}"
-            except json.JSONDecodeError:
-                pass
+        details = f"\nConclusion: {conclusion or 'unknown'}"
+        try:
+            jobs = adapter._github_request(config, 'GET', f"{run_api}/jobs")
+            for job in (jobs or {}).get("jobs", []):
+                if job.get("conclusion") != "success":
+                    details += f"\n  Failed job: {job.get('name')}"
+        except OSError:
+            pass
 
         view_url = f"{config.project_url}/actions/runs/{run_id}" if config.project_url else ""
         return False, f"Windows validation failed.{details}\nView: {view_url}"
@@ -460,25 +678,66 @@ def run_windows_validation(config) -> Tuple[bool, str]:
 
 def prepare_release(config, adapter) -> bool:
     """Prepare release by updating versions and running checks."""
-    print_section(f"\n{'='*70}")
+    print_section("\n" + _BANNER)
     print_section(f"PREPARING RELEASE {config.version} ({adapter.name})")
-    print_section(f"{'='*70}\n")
+    print_section(_BANNER + "\n")
 
-    # Step 0a: Validate Makefile targets
-    print_info("\nStep 0a: Validating Makefile targets...")
-    if not adapter.validate_makefile(config):
+    # Step 0a: Validate AI Assistance & Authorship section (LEGALLY CRITICAL)
+    # Cheapest hard gate (reads README.md only), so it rejects before any
+    # make target or scan runs
+    print_info("\nStep 0a: Validating AI Assistance & Authorship section...")
+    is_valid, ai_errors = _timed(config, 'ai-section', adapter.validate_ai_assistance_section, config)
+    if not is_valid:
+        print_error("AI Assistance & Authorship section validation FAILED")
+        print_error("This is a LEGALLY CRITICAL requirement for all releases")
+        print_info_block([
+            "",
+            "Required section in README.md:",
+            "  ### AI Assistance & Authorship",
+            "",
+            "  This project — including its source code, tests, documentation,",
+            "  and other deliverables — is designed, implemented, and maintained",
+            "  by human developers, with Michael Gardner as the Principal Software",
+            "  Engineer and project lead.",
+            "",
+            "  [... see documentation agent for full required content ...]",
+            "",
+            "Placement: After project description, BEFORE installation instructions",
+        ])
+        return False
+
+    # Step 0b: Validate Makefile targets
+    print_info("\nStep 0b: Validating Makefile targets...")
+    if not _timed(config, 'makefile', adapter.validate_makefile, config):
         print_error("Makefile validation failed - fix targets before release")
         return False
 
-    # Step 0b: Validate documentation links
-    print_info("\nStep 0b: Validating documentation links...")
-    if not adapter.validate_links(config):
+    # Steps 0c-0h only read the tree and git history (0b runs make targets,
+    # which change the tree, so it has finished first). Run them concurrently,
+    # then report each one, with its prompt, in step order.
+    check_exceptions = 'exceptions' not in getattr(config, 'skip_stages', set())
+    checks = [
+        lambda: _timed(config, 'links', adapter.validate_links, config),
+        lambda: _timed(config, 'documentation', adapter.validate_documentation, config),
+        lambda: _timed(config, 'git-history', adapter.scan_git_history_for_ai_markers, config),
+        lambda: _timed(config, 'code-markers', adapter.scan_for_code_markers, config),
+        lambda: _timed(config, 'long-files', adapter.scan_for_long_files, config, max_lines=800),
+    ]
+    if check_exceptions:
+        checks.append(
+            lambda: _timed(config, 'exceptions', adapter.validate_exception_boundaries, config))
+    print_info("\nRunning release checks (Steps 0c-0h)...")
+    reports = iter(_run_checks_concurrently(checks))
+
+    # Step 0c: Validate documentation links
+    print_info("\nStep 0c: Validating documentation links...")
+    if not next(reports)():
         print_error("Link validation failed - fix broken links before release")
         return False
 
-    # Step 0c: Validate documentation consistency
-    print_info("\nStep 0c: Validating documentation consistency...")
-    has_discrepancies, discrepancies = adapter.validate_documentation(config)
+    # Step 0d: Validate documentation consistency
+    print_info("\nStep 0d: Validating documentation consistency...")
+    has_discrepancies, discrepancies = next(reports)()
     if has_discrepancies:
         message = f"""Documentation validation found {len(discrepancies)} potential discrepancy(ies).
 
@@ -495,29 +754,9 @@ You can:
         if not prompt_user_continue(message):
             return False
 
-    # Step 0d: Validate AI Assistance & Authorship section (LEGALLY CRITICAL)
-    print_info("\nStep 0d: Validating AI Assistance & Authorship section...")
-    is_valid, ai_errors = adapter.validate_ai_assistance_section(config)
-    if not is_valid:
-        print_error("AI Assistance & Authorship section validation FAILED")
-        print_error("This is a LEGALLY CRITICAL requirement for all releases")
-        print_info("")
-        print_info("Required section in README.md:")
-        print_info("  ### AI Assistance & Authorship")
-        print_info("")
-        print_info("  This project — including its source code, tests, documentation,")
-        print_info("  and other deliverables — is designed, implemented, and maintained")
-        print_info("  by human developers, with Michael Gardner as the Principal Software")
-        print_info("  Engineer and project lead.")
-        print_info("")
-        print_info("  [... see documentation agent for full required content ...]")
-        print_info("")
-        print_info("Placement: After project description, BEFORE installation instructions")
-        return False
-
     # Step 0e: Scan git history for AI markers (CRITICAL - git hygiene)
     print_info("\nStep 0e: Scanning git history for AI assistant markers...")
-    is_clean, git_violations = adapter.scan_git_history_for_ai_markers(config)
+    is_clean, git_violations = next(reports)()
     if not is_clean:
         print_warning(f"Found {len(git_violations)} AI marker(s) in git history")
         message = f"""Git history contains {len(git_violations)} AI attribution marker(s).
@@ -537,7 +776,7 @@ You can:
 
     # Step 0f: Scan for TODO/FIXME/STUB/ROADMAP markers
     print_info("\nStep 0f: Scanning for TODO/FIXME/STUB/ROADMAP markers...")
-    is_clean, code_markers = adapter.scan_for_code_markers(config)
+    is_clean, code_markers = next(reports)()
     if not is_clean:
         message = f"""Found {len(code_markers)} code marker(s) in source code.
 
@@ -558,7 +797,7 @@ You can:
 
     # Step 0g: Scan for long files
     print_info("\nStep 0g: Scanning for long source files...")
-    is_clean, long_files = adapter.scan_for_long_files(config, max_lines=800)
+    is_clean, long_files = next(reports)()
     if not is_clean:
         message = f"""Found {len(long_files)} source file(s) exceeding 800 lines.
 
@@ -574,9 +813,9 @@ You can:
             return False
 
     # Step 0h: Validate exception handling boundaries (Ada only)
-    if 'exceptions' not in getattr(config, 'skip_stages', set()):
+    if check_exceptions:
         print_info("\nStep 0h: Validating exception handling boundaries...")
-        is_valid, violations = adapter.validate_exception_boundaries(config)
+        is_valid, violations = next(reports)()
         if not is_valid:
             message = f"""Found {len(violations)} exception boundary violation(s).
 
@@ -623,13 +862,15 @@ Press 'q' to quit and fix the violations."""
     is_valid, spark_errors = adapter.validate_spark_section(config)
     if not is_valid:
         print_error("SPARK section validation FAILED")
-        print_info("")
-        print_info("Rules (per documentation agent):")
-        print_info("  - Ada projects: SPARK section MUST exist in README.md")
-        print_info("  - Go projects: SPARK section MUST NOT exist (Ada-specific)")
-        print_info("")
-        print_info("For Ada projects, see documentation agent for required format.")
-        print_info("Results field should reference CHANGELOG, not hardcoded metrics.")
+        print_info_block([
+            "",
+            "Rules (per documentation agent):",
+            "  - Ada projects: SPARK section MUST exist in README.md",
+            "  - Go projects: SPARK section MUST NOT exist (Ada-specific)",
+            "",
+            "For Ada projects, see documentation agent for required format.",
+            "Results field should reference CHANGELOG, not hardcoded metrics.",
+        ])
         message = """SPARK section validation failed.
 
 You can:
@@ -639,10 +880,10 @@ You can:
             return False
 
     # Step 6: CHANGELOG checkpoint
-    changelog_file = config.project_root / "CHANGELOG.md"
+    changelog_file = config.changelog_path
     if changelog_file.exists():
-        content = changelog_file.read_text(encoding='utf-8')
-        if not re.search(rf'## \[{re.escape(config.version)}\]', content):
+        content = load_changelog(changelog_file)
+        if f'## [{config.version}]' not in content:
             message = f"""FINAL CHECKPOINT: CHANGELOG.md Review
 
 The script is about to modify CHANGELOG.md:
@@ -667,13 +908,13 @@ If CHANGELOG is already correct, just press ENTER to continue."""
 
     # Step 7: Build verification (before commit - verify code compiles)
     print_info("\nStep 7: Running build...")
-    if not adapter.run_build(config):
+    if not _timed(config, 'build', adapter.run_build, config):
         print_error("Build failed")
         return False
 
     # Step 8: Test verification (before commit - verify tests pass and capture counts)
     print_info("\nStep 8: Running tests...")
-    if not adapter.run_tests(config):
+    if not _timed(config, 'tests', adapter.run_tests, config):
         print_error("Tests failed")
         return False
 
@@ -710,17 +951,17 @@ After committing, press ENTER to continue with additional verification."""
     skip_stages = getattr(config, 'skip_stages', set())
     if hasattr(adapter, 'run_spark_check') and 'spark' not in skip_stages:
         print_info("\nStep 9: Running SPARK legality check...")
-        if not adapter.run_spark_check(config):
+        if not _timed(config, 'spark-check', adapter.run_spark_check, config):
             print_error("SPARK check failed")
             return False
     elif 'spark' in skip_stages:
         print_info("\nStep 9: Skipping SPARK check (--skip=spark)")
 
     # Step 10: Windows CI validation (pre-flight check)
-    workflow_path = config.project_root / ".github" / "workflows" / "windows-release.yml"
-    if workflow_path.exists() and 'windows' not in skip_stages:
+    run_windows = config.windows_workflow_path.exists() and 'windows' not in skip_stages
+    if run_windows:
         print_info("\nStep 10: Running Windows CI validation (pre-flight)...")
-        success, message = run_windows_validation(config)
+        success, message = _timed(config, 'windows-ci', run_windows_validation, config, adapter)
         if not success:
             print_error(f"Windows validation failed: {message}")
             print_info("Use --skip=windows to bypass this check for local dev releases")
@@ -758,44 +999,39 @@ You can:
             print_warning("  Could not reset config files (manual cleanup may be needed)")
     else:
         # Fallback: use git checkout for config directory
-        result = subprocess.run(
-            ["git", "checkout", "config/"],
-            capture_output=True,
-            text=True,
-            cwd=config.project_root
-        )
+        result = _git(config.project_root, "checkout", "config/", capture=False)
         if result.returncode == 0:
             print_success("  Config files restored via git checkout")
         else:
             print_warning("  Could not reset config files (manual cleanup may be needed)")
 
-    print_section(f"\n{'='*70}")
+    print_section("\n" + _BANNER)
     print_success(f"RELEASE {config.version} PREPARED AND VERIFIED SUCCESSFULLY!")
-    print_section(f"{'='*70}\n")
-    print_info("All files updated")
-    print_info("Build passing")
-    print_info("Tests passing (macOS)")
-    if workflow_path.exists() and 'windows' not in skip_stages:
-        print_info("Tests passing (Windows CI)")
-    print_info("Submodules verified")
-    print()
-    print_info("Next step:")
-    print_info(f"   python3 scripts/python/release/release.py release {config.version}")
-    print()
-    print_info("This will:")
-    print_info(f"  - Create git tag v{config.version}")
-    print_info("  - Push to GitHub")
-    print_info("  - Create GitHub release with release notes")
-    print()
+    print_section(_BANNER + "\n")
+    summary = ["All files updated", "Build passing", "Tests passing (macOS)"]
+    if run_windows:
+        summary.append("Tests passing (Windows CI)")
+    print_info_block(summary + [
+        "Submodules verified",
+        "",
+        "Next step:",
+        f"   python3 scripts/python/release/release.py release {config.version}",
+        "",
+        "This will:",
+        f"  - Create git tag v{config.version}",
+        "  - Push to GitHub",
+        "  - Create GitHub release with release notes",
+        "",
+    ])
 
     return True
 
 
 def create_release(config, adapter) -> bool:
     """Create the actual release (tag and publish)."""
-    print_section(f"\n{'='*70}")
+    print_section("\n" + _BANNER)
     print_section(f"CREATING RELEASE {config.version} ({adapter.name})")
-    print_section(f"{'='*70}\n")
+    print_section(_BANNER + "\n")
 
     # Verify working tree is clean
     print_info("Verifying clean working tree...")
@@ -822,18 +1058,20 @@ def create_release(config, adapter) -> bool:
 
     # Alire index reminder (Ada projects)
     if config.language == 'ada':
-        print_info("\n" + "="*60)
-        print_info("ALIRE PUBLISH REMINDER")
-        print_info("="*60)
-        print_info("Before running 'alr publish', update your local Alire index")
-        print_info("to access any new dependency releases:")
-        print_info("")
-        print_info("  # Update local Alire index cache")
-        print_info("  alr index --update-all")
-        print_info("")
-        print_info("  # Verify dependency is visible (example)")
-        print_info("  alr search <crate>=<version>")
-        print_info("="*60 + "\n")
+        print_info_block([
+            "\n" + "="*60,
+            "ALIRE PUBLISH REMINDER",
+            "="*60,
+            "Before running 'alr publish', update your local Alire index",
+            "to access any new dependency releases:",
+            "",
+            "  # Update local Alire index cache",
+            "  alr index --update-all",
+            "",
+            "  # Verify dependency is visible (example)",
+            "  alr search <crate>=<version>",
+            "="*60 + "\n",
+        ])
 
     # SPARK PROVE (Ada libraries only - post-release verification)
     spark_summary = None
@@ -855,38 +1093,56 @@ def create_release(config, adapter) -> bool:
             # Commit and push SPARK documentation updates
             import subprocess
             try:
-                subprocess.run(['git', 'add', 'README.md', 'CHANGELOG.md'],
-                             cwd=config.project_root, check=True, capture_output=True)
-                subprocess.run(['git', 'commit', '-m', 'docs: update SPARK status after verification'],
-                             cwd=config.project_root, check=True, capture_output=True)
-                subprocess.run(['git', 'push'],
-                             cwd=config.project_root, check=True, capture_output=True)
+                _git(config.project_root, 'add', 'README.md', 'CHANGELOG.md', check=True, capture=False)
+                _git(config.project_root, 'commit', '-m', 'docs: update SPARK status after verification',
+                     check=True, capture=False)
+                _git(config.project_root, 'push', check=True, capture=False)
                 print("  Committed and pushed SPARK documentation updates")
             except subprocess.CalledProcessError:
                 print("  Note: No SPARK doc changes to commit (already up to date)")
     elif 'spark' in skip_stages:
         print_info("\nSkipping SPARK PROVE (--skip=spark)")
 
-    print_section(f"\n{'='*70}")
+    print_section("\n" + _BANNER)
     print_success(f"RELEASE {config.version} CREATED SUCCESSFULLY!")
-    print_section(f"{'='*70}\n")
-    print_info("Release is now live on GitHub!")
+    print_section(_BANNER + "\n")
+    # Only format the optional lines that will actually be shown
+    closing = ["Release is now live on GitHub!"]
     if config.project_url:
-        release_url = f"{config.project_url}/releases/tag/v{config.version}"
-        print_info(f"View at: {release_url}")
+        closing.append(f"View at: {config.project_url}/releases/tag/v{config.version}")
     if spark_summary:
-        print_info(f"SPARK verification: {spark_summary}")
+        closing.append(f"SPARK verification: {spark_summary}")
+    print_info_block(closing)
     print()
 
     return True
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description='Unified release management for Go and Ada projects',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _validate_release(config, adapter) -> bool:
+    """Validation-only mode (not implemented yet)."""
+    # Future: add validation-only mode
+    print_info("Validate action not yet implemented")
+    return True
+
+
+# Command-line actions and their handlers, and the stages --skip accepts
+# (with descriptions)
+_ACTION_HANDLERS = {
+    'prepare': prepare_release,
+    'release': create_release,
+    'validate': _validate_release,
+}
+_ACTIONS = tuple(_ACTION_HANDLERS)
+_SKIPPABLE_STAGES = {
+    'windows': 'Windows CI validation',
+    'spark': 'SPARK verification',
+    'exceptions': 'Exception boundary validation',
+}
+_SKIPPABLE_KEYS = frozenset(_SKIPPABLE_STAGES)
+_STAGE_LIST = ', '.join(_SKIPPABLE_STAGES)
+
+# --help epilog (argparse expands %(prog)s when printing it)
+_EPILOG = """
 Examples:
   %(prog)s prepare 1.0.0                Prepare release (all stages)
   %(prog)s prepare 1.0.0 --skip=spark   Skip SPARK verification
@@ -894,16 +1150,24 @@ Examples:
                                         Skip multiple stages
   %(prog)s release 1.0.0                Create release (tag, push, GitHub)
 
-Skippable stages: windows, spark, exceptions, all
+Skippable stages: """ + _STAGE_LIST + """, all
 
 The script auto-detects the project language (Go/Ada) and applies
 the appropriate release workflow.
-        """
+"""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        description='Unified release management for Go and Ada projects',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
 
     parser.add_argument(
         'action',
-        choices=['prepare', 'release', 'validate'],
+        choices=_ACTIONS,
         help='Action to perform'
     )
 
@@ -926,69 +1190,83 @@ the appropriate release workflow.
         help='Show what would be done without making changes'
     )
 
-    # Define skippable stages with their descriptions
-    skippable_stages = {
-        'windows': 'Windows CI validation',
-        'spark': 'SPARK verification',
-        'exceptions': 'Exception boundary validation',
-    }
-    stage_list = ', '.join(skippable_stages.keys())
-
     parser.add_argument(
         '--skip',
         type=str,
         default='',
         metavar='STAGES',
-        help=f'Skip specific stages (comma-separated). Available: {stage_list}, all'
+        help='Skip specific stages (comma-separated). Available: ' + _STAGE_LIST + ', all'
     )
 
+    parser.add_argument(
+        '--perf-log',
+        type=Path,
+        default=None,
+        metavar='FILE',
+        help='Append the wall-clock time of each check, build and test step to FILE'
+    )
+
+    return parser
+
+
+def main():
+    """Main entry point."""
+    # With no arguments at all there is nothing to run: report that before
+    # building the full parser. Anything else (including typos and --help
+    # abbreviations) goes to argparse, which reports it precisely.
+    if not sys.argv[1:]:
+        prog = os.path.basename(sys.argv[0])
+        print(f"usage: {prog} [options] {{{','.join(_ACTIONS)}}} [version]\n"
+              f"{prog}: error: the following arguments are required: action",
+              file=sys.stderr)
+        return 2
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Parse --skip into a set of stages
     if args.skip:
-        if args.skip.lower() == 'all':
-            args.skip_stages = set(skippable_stages.keys())
+        lowered = args.skip.lower()
+        if lowered == 'all':
+            args.skip_stages = set(_SKIPPABLE_KEYS)
         else:
-            args.skip_stages = set(s.strip().lower() for s in args.skip.split(','))
+            args.skip_stages = set(map(str.strip, lowered.split(',')))
             # Validate stage names
-            invalid = args.skip_stages - set(skippable_stages.keys())
+            invalid = args.skip_stages - _SKIPPABLE_KEYS
             if invalid:
                 print_error(f"Unknown skip stage(s): {', '.join(invalid)}")
-                print_info(f"Available stages: {stage_list}, all")
+                print_info(f"Available stages: {_STAGE_LIST}, all")
                 return 1
     else:
         args.skip_stages = set()
 
-    # Validate version is provided for prepare/release
-    if args.action in ['prepare', 'release', 'validate'] and not args.version:
+    # Validate version is provided (every action needs one)
+    if not args.version:
         print_error(f"Version is required for {args.action} action")
         parser.print_help()
         return 1
 
     # Validate semantic version format
-    if args.version and not re.match(
-        r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$',
-        args.version
-    ):
+    if args.version and not _valid_semver(args.version):
         print_error("Version must follow semantic versioning (e.g., 1.0.0, 1.0.0-dev)")
         return 1
 
     # Determine project root
     if args.project_root:
-        project_root = args.project_root.resolve()
+        # Lexical absolute path ('..' collapsed); no per-component stat/readlink
+        project_root = Path(os.path.abspath(args.project_root))
     else:
         # Auto-detect: go up from script location to find project root
         # scripts/python/shared/release/release.py -> release -> shared -> python -> scripts -> project_root
         script_dir = Path(__file__).parent
         project_root = script_dir.parent.parent.parent.parent
 
-    if not project_root.exists():
-        print_error(f"Project root does not exist: {project_root}")
-        return 1
-
-    # Detect language
-    language = detect_language(project_root)
+    # Detect language (a missing root is only checked for when detection fails)
+    language = _detect_language_cached(str(project_root))
     if not language:
+        if not project_root.exists():
+            print_error(f"Project root does not exist: {project_root}")
+            return 1
         print_error(f"Could not detect language in: {project_root}")
         print_info("Supported languages: Go, Ada")
         return 1
@@ -999,11 +1277,6 @@ the appropriate release workflow.
         print_error(f"No adapter available for language: {language.value}")
         return 1
 
-    # Load project info
-    project_name, project_url = adapter.load_project_info(
-        type('Config', (), {'project_root': project_root})()
-    )
-
     # Create config
     config = ReleaseConfig(
         project_root=project_root,
@@ -1011,29 +1284,25 @@ the appropriate release workflow.
         language=language,
         dry_run=args.dry_run,
     )
+
+    # Load project info (only reads config.project_root)
+    project_name, project_url = adapter.load_project_info(config)
     config.project_name = project_name
     config.project_url = project_url
     config.skip_stages = args.skip_stages
+    config.perf_log = args.perf_log
 
-    print_info(f"Project: {project_name}")
-    print_info(f"Language: {language.value}")
-    print_info(f"Root: {project_root}")
+    print_info_block([
+        f"Project: {project_name}",
+        f"Language: {language.value}",
+        f"Root: {project_root}",
+    ])
     if args.skip_stages:
         print_info(f"Skipping: {', '.join(sorted(args.skip_stages))}")
 
     try:
-        if args.action == 'prepare':
-            success = prepare_release(config, adapter)
-        elif args.action == 'release':
-            success = create_release(config, adapter)
-        elif args.action == 'validate':
-            # Future: add validation-only mode
-            print_info("Validate action not yet implemented")
-            success = True
-        else:
-            print_error(f"Unknown action: {args.action}")
-            return 1
-
+        # argparse has already limited the action to _ACTIONS
+        success = _ACTION_HANDLERS[args.action](config, adapter)
         return 0 if success else 1
 
     except KeyboardInterrupt:
@@ -1041,8 +1310,9 @@ the appropriate release workflow.
         return 1
     except Exception as e:
         print_error(f"Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        # Bounded trace: outermost 20 frames, without chained exceptions
+        traceback.print_exception(type(e), e, e.__traceback__,
+                                  limit=20, chain=False, file=sys.stderr)
         return 1
 
 